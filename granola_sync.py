@@ -6,35 +6,99 @@ Exports meeting transcripts from Granola's local cache to Obsidian vault.
 Adds meeting summaries to daily reflection files.
 """
 
+import calendar
 import json
-import re
+import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from utils import (
     setup_logging,
     load_config,
-    format_frontmatter,
     get_unprocessed_transcripts,
     parse_iso_timestamp,
     get_notes_text,
+    json_loads,
+    read_frontmatter_block,
+    parse_frontmatter_fields,
+    atomic_write_bytes,
+    load_sync_index,
+    save_sync_index,
+    rebuild_sync_index,
+    format_yaml_scalar,
 )
 
 logger = setup_logging(__name__)
 
+_INVALID_FN_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_SENTENCE_END_CHARS = frozenset(".!?")
+
+# Skeleton for new daily reflection files
+DAILY_TEMPLATE = """# {date} ({day})
+
+## Schedule
+| Time | What |
+|------|------|
+
+---
+
+## Work
+
+---
+
+## Meetings
+
+---
+
+## Social / Follow-ups
+
+---
+
+## Brain Dump
+
+---
+"""
+
+# Sync work is dominated by filesystem calls, so threads overlap well
+SYNC_MAX_WORKERS = 8
+
+# Daily file contents keyed by path, validated against (mtime_ns, size), so
+# several meetings on the same day don't re-read the file on every add.
+# Cleared at the end of each sync.
+_daily_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+
+# Directories already created during the current sync
+_ensured_dirs: set[Path] = set()
+
 
 def load_granola_cache(cache_path: Path) -> dict:
-    """Load and parse Granola's cache file."""
-    if not cache_path.exists():
+    """
+    Load and parse Granola's cache file.
+
+    Parsed results are memoized per (path, mtime, size), so repeated calls
+    while Granola hasn't rewritten the file skip parsing. Callers must treat
+    the returned dict as read-only.
+    """
+    try:
+        st = os.stat(cache_path)
+    except FileNotFoundError:
         logger.error(f"Granola cache not found: {cache_path}")
         return {"documents": {}, "transcripts": {}}
 
+    return _parse_granola_cache(str(cache_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _parse_granola_cache(cache_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse Granola's cache file; mtime_ns and size only key the memo."""
     try:
-        with open(cache_path) as f:
-            data = json.load(f)
+        with open(cache_path, "rb") as f:
+            data = json_loads(f.read())
 
-        cache = json.loads(data.get("cache", "{}"))
+        cache = json_loads(data.get("cache", "{}"))
         state = cache.get("state", {})
 
         return {
@@ -50,7 +114,7 @@ def load_granola_cache(cache_path: Path) -> dict:
 def sanitize_filename(title: str) -> str:
     """Sanitize a string for use as a filename."""
     # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
+    sanitized = title.translate(_INVALID_FN_CHARS)
     sanitized = sanitized.strip()
     # Limit length
     if len(sanitized) > 100:
@@ -63,15 +127,19 @@ def get_transcript_text(entries: list) -> str:
     if not entries:
         return ""
 
-    texts = []
-    for e in entries:
-        text = e.get("text", "")
-        # Handle case where text might be a dict or other type
-        if isinstance(text, str) and text:
-            texts.append(text)
-        elif isinstance(text, dict):
-            # Try to extract text from dict if possible
-            texts.append(str(text.get("content", text.get("text", ""))))
+    raw_texts = [e.get("text", "") for e in entries]
+    if all(type(text) is str for text in raw_texts):
+        # Common case: every entry's text is a plain string
+        texts = [text for text in raw_texts if text]
+    else:
+        texts = []
+        for text in raw_texts:
+            # Handle case where text might be a dict or other type
+            if isinstance(text, str) and text:
+                texts.append(text)
+            elif isinstance(text, dict):
+                # Try to extract text from dict if possible
+                texts.append(str(text.get("content", text.get("text", ""))))
 
     if not texts:
         return ""
@@ -79,14 +147,18 @@ def get_transcript_text(entries: list) -> str:
     # Group into paragraphs (roughly every 5-10 sentences or by speaker change)
     paragraphs = []
     current_paragraph = []
+    # Running length of " ".join(current_paragraph), so we only join on flush
+    current_len = -1
 
     for text in texts:
         current_paragraph.append(text)
+        current_len += len(text) + 1
         # Start new paragraph every ~10 sentences or at natural breaks
-        if len(current_paragraph) >= 10 or text.endswith((".", "!", "?")):
-            if len(" ".join(current_paragraph)) > 500:
+        if len(current_paragraph) >= 10 or text[-1:] in _SENTENCE_END_CHARS:
+            if current_len > 500:
                 paragraphs.append(" ".join(current_paragraph))
                 current_paragraph = []
+                current_len = -1
 
     if current_paragraph:
         paragraphs.append(" ".join(current_paragraph))
@@ -124,119 +196,224 @@ def get_meeting_date(entries: list, doc: dict) -> datetime:
     return datetime.now()
 
 
+def format_date(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD without going through strftime."""
+    return _format_ordinal_date(dt.toordinal())
+
+
+@lru_cache(maxsize=512)
+def _format_ordinal_date(ordinal: int) -> str:
+    # Meetings cluster on a few days, so most lookups hit the cache
+    d = date.fromordinal(ordinal)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _attendees_from_list(people: list) -> list:
+    """Extract attendee emails (or names) from a list of people."""
+    attendees = []
+    for p in people:
+        if isinstance(p, dict):
+            email = p.get("email") or p.get("name", "")
+            if email:
+                attendees.append(email)
+        elif isinstance(p, str):
+            attendees.append(p)
+    return attendees
+
+
+def _attendees_from_dict(people: dict) -> list:
+    """New structure: people is a dict with an 'attendees' list."""
+    attendees_list = people.get("attendees", [])
+    if isinstance(attendees_list, list):
+        return _attendees_from_list(attendees_list)
+    return []
+
+
+# Extractors for the different structures of the people field, by exact type
+_ATTENDEE_EXTRACTORS = {
+    dict: _attendees_from_dict,
+    list: _attendees_from_list,  # Old structure: people is a list directly
+}
+
+
 def get_attendees(doc: dict) -> list:
     """Extract attendees from document."""
     people = doc.get("people", {})
-    attendees = []
+    extractor = _ATTENDEE_EXTRACTORS.get(type(people))
+    return extractor(people) if extractor else []
 
-    # Handle different structures of the people field
-    if isinstance(people, dict):
-        # New structure: people is a dict with 'attendees' key
-        attendees_list = people.get("attendees", [])
-        if isinstance(attendees_list, list):
-            for p in attendees_list:
-                if isinstance(p, dict):
-                    email = p.get("email") or p.get("name", "")
-                    if email:
-                        attendees.append(email)
-                elif isinstance(p, str):
-                    attendees.append(p)
-    elif isinstance(people, list):
-        # Old structure: people is a list directly
-        for p in people:
-            if isinstance(p, dict):
-                email = p.get("email") or p.get("name", "")
-                if email:
-                    attendees.append(email)
-            elif isinstance(p, str):
-                attendees.append(p)
 
-    return attendees
+def format_transcript_frontmatter(
+    date_str: str,
+    title: str,
+    doc_id: str,
+    duration: int,
+    entry_count: int,
+    attendees: list
+) -> str:
+    """
+    Format frontmatter for a new transcript file.
+
+    Output matches format_frontmatter for the fixed transcript schema without
+    per-key type dispatch.
+    """
+    frontmatter = (
+        f"---\n"
+        f"date: {date_str}\n"
+        f"title: {format_yaml_scalar(title)}\n"
+        f"source: granola\n"
+        f"granola_id: {format_yaml_scalar(doc_id)}\n"
+        f"duration_minutes: {duration}\n"
+        f"entry_count: {entry_count}\n"
+        f"processed: false\n"
+    )
+    if attendees:
+        frontmatter += "attendees:\n" + "".join(
+            f"  - {format_yaml_scalar(str(att))}\n" for att in attendees
+        )
+    return frontmatter + "---"
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory once per sync; later calls skip the mkdir syscalls."""
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def list_transcript_names(transcripts_dir: Path) -> set[str]:
+    """List filenames in the transcripts folder with a single directory scan."""
+    try:
+        with os.scandir(transcripts_dir) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+
+def _transcript_exists(
+    transcripts_dir: str,
+    filename: str,
+    existing_names: set[str] | None
+) -> bool:
+    if existing_names is None:
+        return os.path.exists(os.path.join(transcripts_dir, filename))
+    return filename in existing_names
 
 
 def generate_transcript_file(
     doc_id: str,
     doc: dict,
     entries: list,
-    config: dict
-) -> tuple[Path, bool]:
+    config: dict,
+    existing_names: set[str] | None = None,
+    meeting_dt: datetime | None = None
+) -> tuple[Path, bool, datetime, str]:
     """
     Generate a transcript markdown file.
-    Returns (file_path, was_created).
+
+    existing_names, if given, is the set of filenames already in the
+    transcripts folder (see list_transcript_names); it replaces per-file
+    exists() checks and is updated with the new filename. meeting_dt, if
+    given, is the already-computed get_meeting_date(entries, doc).
+
+    Returns (file_path, was_created, meeting_dt, notes).
     """
     title = doc.get("title", "Untitled Meeting")
-    meeting_dt = get_meeting_date(entries, doc)
-    date_str = meeting_dt.strftime("%Y-%m-%d")
-    time_str = meeting_dt.strftime("%H%M")
+    if meeting_dt is None:
+        meeting_dt = get_meeting_date(entries, doc)
+    # Get notes (Granola's AI summary)
+    notes = get_notes_text(doc)
+    date_str = format_date(meeting_dt)
+    time_str = f"{meeting_dt.hour:02d}{meeting_dt.minute:02d}"
 
     # Build filename
     safe_title = sanitize_filename(title)
     base_filename = f"{date_str} - {safe_title}"
 
     transcripts_dir = config["obsidian_vault"] / config["transcripts_folder"]
-    transcripts_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(transcripts_dir)
+    # Conflict checks work on plain strings; a Path is only built for the result
+    transcripts_dir_str = os.fspath(transcripts_dir)
 
     # Check for conflicts (same title, same day)
-    file_path = transcripts_dir / f"{base_filename}.md"
-    if file_path.exists():
+    filename = f"{base_filename}.md"
+    if _transcript_exists(transcripts_dir_str, filename, existing_names):
         # Check if it's the same document (by granola_id in frontmatter)
-        existing_content = file_path.read_text()
-        if f"granola_id: {doc_id}" in existing_content:
-            logger.debug(f"Skipping existing transcript: {file_path.name}")
-            return file_path, False
+        existing_frontmatter = read_frontmatter_block(os.path.join(transcripts_dir_str, filename))
+        existing_id = parse_frontmatter_fields(
+            existing_frontmatter.decode("utf-8", errors="replace"), {"granola_id"}
+        ).get("granola_id")
+        # Ids YAML would retype are written quoted, older files may have them bare
+        if existing_id is not None and str(existing_id) == doc_id:
+            logger.debug(f"Skipping existing transcript: {filename}")
+            return transcripts_dir / filename, False, meeting_dt, notes
         # Different meeting, same title - add time suffix
-        file_path = transcripts_dir / f"{date_str} - {safe_title} ({time_str}).md"
-        if file_path.exists():
-            logger.debug(f"Skipping existing transcript: {file_path.name}")
-            return file_path, False
+        filename = f"{date_str} - {safe_title} ({time_str}).md"
+        if _transcript_exists(transcripts_dir_str, filename, existing_names):
+            logger.debug(f"Skipping existing transcript: {filename}")
+            return transcripts_dir / filename, False, meeting_dt, notes
 
-    # Get notes (Granola's AI summary)
-    notes = get_notes_text(doc)
+    file_path = transcripts_dir / filename
 
     # Calculate metadata
     duration = calculate_duration(entries)
     attendees = get_attendees(doc)
 
     # Build frontmatter
-    frontmatter_data = {
-        "date": date_str,
-        "title": title,
-        "source": "granola",
-        "granola_id": doc_id,
-        "duration_minutes": duration,
-        "entry_count": len(entries),
-        "processed": False
-    }
-    if attendees:
-        frontmatter_data["attendees"] = attendees
-
-    frontmatter = format_frontmatter(frontmatter_data)
+    frontmatter = format_transcript_frontmatter(
+        date_str, title, doc_id, duration, len(entries), attendees
+    )
 
     # Get transcript text
     transcript_text = get_transcript_text(entries)
 
-    # Build content
-    content_parts = [frontmatter, ""]
+    # Build content as UTF-8 chunks so the transcript body is encoded once
+    # and written without first being copied into one joined buffer
+    notes_bytes = notes.encode() if notes else b"*No AI notes available - will be generated during processing*"
+    content_parts = [
+        frontmatter.encode(),
+        b"\n\n## Notes\n\n",
+        notes_bytes,
+        b"\n\n---\n\n## Transcript\n\n",
+        transcript_text.encode(),
+    ]
 
-    if notes:
-        content_parts.extend(["## Notes", "", notes, "", "---", ""])
-    else:
-        content_parts.extend(["## Notes", "", "*No AI notes available - will be generated during processing*", "", "---", ""])
+    # Write file
+    atomic_write_bytes(file_path, content_parts)
+    if existing_names is not None:
+        existing_names.add(file_path.name)
+    logger.debug(f"Created transcript: {file_path.name}")
 
-    content_parts.extend(["## Transcript", "", transcript_text])
+    return file_path, True, meeting_dt, notes
 
-    content = "\n".join(content_parts)
 
-    # Write file
-    file_path.write_text(content)
-    logger.info(f"Created transcript: {file_path.name}")
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def read_daily_file(daily_path: Path) -> str:
+    """Read a daily file, reusing the cached content if it hasn't changed."""
+    key = _stat_key(daily_path)
+    cached = _daily_cache.get(daily_path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    content = daily_path.read_text(encoding="utf-8")
+    _daily_cache[daily_path] = (key, content)
+    return content
+
 
-    return file_path, True
+def write_daily_file(daily_path: Path, content: str) -> None:
+    """Write a daily file and refresh its cache entry."""
+    atomic_write_bytes(daily_path, content.encode())
+    _daily_cache[daily_path] = (_stat_key(daily_path), content)
 
 
 def get_daily_file_path(meeting_dt: datetime, config: dict) -> Path:
     """Get path to daily reflection file for a given date."""
-    date_str = meeting_dt.strftime("%Y-%m-%d")
+    date_str = format_date(meeting_dt)
     daily_dir = config["obsidian_vault"] / config["daily_folder"]
     return daily_dir / f"{date_str}.md"
 
@@ -249,39 +426,16 @@ def create_daily_file(meeting_dt: datetime, config: dict) -> Path:
         return file_path
 
     # Ensure directory exists
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(file_path.parent)
 
     # Get day of week
-    day_name = meeting_dt.strftime("%A")
-    date_str = meeting_dt.strftime("%Y-%m-%d")
-
-    template = f"""# {date_str} ({day_name})
-
-## Schedule
-| Time | What |
-|------|------|
+    day_name = calendar.day_name[meeting_dt.weekday()]
+    date_str = format_date(meeting_dt)
 
----
-
-## Work
-
----
+    template = DAILY_TEMPLATE.format(date=date_str, day=day_name)
 
-## Meetings
-
----
-
-## Social / Follow-ups
-
----
-
-## Brain Dump
-
----
-"""
-
-    file_path.write_text(template)
-    logger.info(f"Created daily file: {file_path.name}")
+    write_daily_file(file_path, template)
+    logger.debug(f"Created daily file: {file_path.name}")
 
     return file_path
 
@@ -297,10 +451,11 @@ def add_meeting_to_daily(
     daily_path = get_daily_file_path(meeting_dt, config)
 
     # Create file if it doesn't exist
-    if not daily_path.exists():
+    try:
+        content = read_daily_file(daily_path)
+    except FileNotFoundError:
         create_daily_file(meeting_dt, config)
-
-    content = daily_path.read_text()
+        content = read_daily_file(daily_path)
 
     # Get relative path for Obsidian link
     vault_path = config["obsidian_vault"]
@@ -339,25 +494,21 @@ def add_meeting_to_daily(
 """
 
     # Find ## Meetings section and add entry
-    if "## Meetings" in content:
-        # Insert after ## Meetings line
-        parts = content.split("## Meetings")
-        if len(parts) == 2:
-            before = parts[0]
-            after = parts[1]
-
-            # Find the next section (starts with ##)
-            next_section_match = re.search(r'\n## ', after)
-            if next_section_match:
-                meetings_content = after[:next_section_match.start()]
-                rest = after[next_section_match.start():]
-                new_content = before + "## Meetings" + meetings_content + meeting_entry + rest
-            else:
-                new_content = before + "## Meetings" + after.rstrip() + meeting_entry + "\n"
-
-            daily_path.write_text(new_content)
-            logger.info(f"Added '{title}' to daily file: {daily_path.name}")
-            return True
+    marker = "## Meetings"
+    idx = content.find(marker)
+    # Only insert when the section heading appears exactly once
+    if idx != -1 and content.find(marker, idx + len(marker)) == -1:
+        # Insert after ## Meetings line, before the next section (starts with ##)
+        after_start = idx + len(marker)
+        next_idx = content.find("\n## ", after_start)
+        if next_idx != -1:
+            new_content = content[:next_idx] + meeting_entry + content[next_idx:]
+        else:
+            new_content = content[:after_start] + content[after_start:].rstrip() + meeting_entry + "\n"
+
+        write_daily_file(daily_path, new_content)
+        logger.debug(f"Added '{title}' to daily file: {daily_path.name}")
+        return True
 
     # If no Meetings section, try to add one before Brain Dump
     if "## Brain Dump" in content:
@@ -365,57 +516,54 @@ def add_meeting_to_daily(
             "## Brain Dump",
             f"## Meetings\n{meeting_entry}\n---\n\n## Brain Dump"
         )
-        daily_path.write_text(content)
-        logger.info(f"Created Meetings section and added '{title}' to: {daily_path.name}")
+        write_daily_file(daily_path, content)
+        logger.debug(f"Created Meetings section and added '{title}' to: {daily_path.name}")
         return True
 
     # Last resort: append to end
     content = content.rstrip() + f"\n\n## Meetings\n{meeting_entry}"
-    daily_path.write_text(content)
-    logger.info(f"Appended Meetings section with '{title}' to: {daily_path.name}")
+    write_daily_file(daily_path, content)
+    logger.debug(f"Appended Meetings section with '{title}' to: {daily_path.name}")
     return True
 
 
-def sync_transcripts(config: dict) -> dict:
-    """
-    Main sync function.
-    Returns stats about what was synced.
-    """
-    stats = {
+def _empty_stats() -> dict:
+    return {
         "transcripts_created": 0,
         "transcripts_skipped": 0,
         "daily_entries_added": 0,
         "errors": 0
     }
 
-    cache = load_granola_cache(config["granola_cache"])
-    documents = cache["documents"]
-    transcripts = cache["transcripts"]
-
-    logger.info(f"Found {len(documents)} documents, {len(transcripts)} with transcripts")
-
-    for doc_id, entries in transcripts.items():
-        if not entries:
-            continue
 
-        doc = documents.get(doc_id, {})
-        if not doc:
-            logger.warning(f"Document not found for transcript: {doc_id}")
-            continue
+def _sync_documents(
+    batch: list[tuple[str, dict, list, datetime]],
+    config: dict,
+    existing_names: set[str]
+) -> tuple[dict, list[str], dict[str, str]]:
+    """
+    Sync a batch of documents in order.
+    Returns (stats, created_filenames, synced) for the batch, where synced
+    maps each doc_id that now has a transcript file to its filename.
+    """
+    stats = _empty_stats()
+    created = []
+    synced = {}
 
+    for doc_id, doc, entries, meeting_dt in batch:
         try:
             # Create transcript file
-            file_path, was_created = generate_transcript_file(
-                doc_id, doc, entries, config
+            file_path, was_created, meeting_dt, notes = generate_transcript_file(
+                doc_id, doc, entries, config, existing_names, meeting_dt
             )
+            synced[doc_id] = file_path.name
 
             if was_created:
                 stats["transcripts_created"] += 1
+                created.append(file_path.name)
 
                 # Add to daily reflections
-                meeting_dt = get_meeting_date(entries, doc)
                 title = doc.get("title", "Untitled Meeting")
-                notes = get_notes_text(doc)
 
                 if add_meeting_to_daily(meeting_dt, title, notes, file_path, config):
                     stats["daily_entries_added"] += 1
@@ -426,6 +574,96 @@ def sync_transcripts(config: dict) -> dict:
             logger.error(f"Error processing document {doc_id}: {e}")
             stats["errors"] += 1
 
+    return stats, created, synced
+
+
+def sync_transcripts(config: dict) -> dict:
+    """
+    Main sync function.
+    Returns stats about what was synced.
+    """
+    stats = _empty_stats()
+    # Folders may have been removed since a previous sync in this process
+    _ensured_dirs.clear()
+
+    cache = load_granola_cache(config["granola_cache"])
+    documents = cache["documents"]
+    transcripts = cache["transcripts"]
+
+    logger.info(f"Found {len(documents)} documents, {len(transcripts)} with transcripts")
+
+    # Stale transcripts without a document (or with an empty one) are
+    # reported once, not per entry
+    synced_ids = {k for k in documents.keys() & transcripts.keys() if documents[k]}
+    orphaned = len(transcripts) - len(synced_ids)
+    if orphaned:
+        logger.warning(f"Documents not found for {orphaned} transcripts")
+
+    # Documents recorded in the sync index whose transcript still exists are
+    # skipped without touching their files
+    transcripts_dir = config["obsidian_vault"] / config["transcripts_folder"]
+    existing_names = list_transcript_names(transcripts_dir)
+    sync_index = load_sync_index(config)
+    if sync_index is None:
+        sync_index = {}
+        if existing_names:
+            # Missing index with transcripts on disk (first run after
+            # upgrading, or the index was deleted): recover it from their
+            # frontmatter and save it now, even if empty, so later syncs
+            # don't repeat the scan
+            sync_index = rebuild_sync_index(transcripts_dir)
+            save_sync_index(config, sync_index)
+    indexed_ids = {
+        doc_id for doc_id, filename in sync_index.items()
+        if doc_id in synced_ids and filename in existing_names
+    }
+
+    # Group by meeting date: transcript filenames and daily files are both
+    # keyed by date, so each group can be synced on its own thread without
+    # two threads touching the same file. Within a group, cache order is kept
+    # so same-title conflicts resolve deterministically. The meeting date is
+    # parsed once here and carried into the batch, so the file and its daily
+    # entry always use the date the group was keyed by.
+    by_date: dict[str, list[tuple[str, dict, list, datetime]]] = {}
+    for doc_id, entries in transcripts.items():
+        if not entries or doc_id not in synced_ids:
+            continue
+        if doc_id in indexed_ids:
+            stats["transcripts_skipped"] += 1
+            continue
+
+        doc = documents[doc_id]
+        try:
+            meeting_dt = get_meeting_date(entries, doc)
+        except Exception as e:
+            logger.error(f"Error processing document {doc_id}: {e}")
+            stats["errors"] += 1
+            continue
+        by_date.setdefault(format_date(meeting_dt), []).append((doc_id, doc, entries, meeting_dt))
+
+    # Per-file messages are logged at DEBUG; INFO gets one summary line
+    created = []
+    with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as executor:
+        for batch_stats, batch_created, batch_synced in executor.map(
+            lambda batch: _sync_documents(batch, config, existing_names),
+            by_date.values()
+        ):
+            for key, count in batch_stats.items():
+                stats[key] += count
+            created.extend(batch_created)
+            sync_index.update(batch_synced)
+
+    if by_date:
+        save_sync_index(config, sync_index)
+
+    if created:
+        more = f" (+{len(created) - 10} more)" if len(created) > 10 else ""
+        logger.info(f"Created {len(created)} transcripts: {', '.join(created[:10])}{more}")
+
+    # Daily contents are only reused within a sync; a long-running caller
+    # like the MCP server shouldn't hold every daily note it has touched
+    _daily_cache.clear()
+
     return stats
 
 
@@ -5,7 +5,7 @@ MCP Server for Granola → Obsidian Sync
 Exposes Granola sync functionality as tools that Claude can use directly.
 """
 
-import json
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +18,8 @@ from utils import (
     load_config,
     parse_frontmatter,
     get_unprocessed_transcripts,
+    json_dumps,
+    map_frontmatter,
 )
 from granola_sync import (
     load_granola_cache,
@@ -29,28 +31,38 @@ logger = setup_logging(__name__)
 # Initialize the MCP server
 app = Server("granola-sync")
 
+# Frontmatter fields reported by format_transcript_info
+TRANSCRIPT_INFO_KEYS = {"title", "date", "duration_minutes", "processed", "attendees"}
 
-def format_transcript_info(file_path: Path) -> dict[str, Any]:
-    """Extract basic info from a transcript file."""
-    try:
-        content = file_path.read_text()
-        frontmatter, _ = parse_frontmatter(content)
 
+def format_transcript_info(file_path: Path, frontmatter: dict | None) -> dict[str, Any]:
+    """Build the listing entry for a transcript from its frontmatter fields."""
+    if frontmatter is None:
+        logger.error(f"Error reading {file_path}")
         return {
             "filename": file_path.name,
-            "title": frontmatter.get("title", "Unknown"),
-            "date": frontmatter.get("date", ""),
-            "duration_minutes": frontmatter.get("duration_minutes", 0),
-            "processed": frontmatter.get("processed", False),
-            "attendees": frontmatter.get("attendees", []),
-        }
-    except Exception as e:
-        logger.error(f"Error reading {file_path}: {e}")
-        return {
-            "filename": file_path.name,
-            "error": str(e)
+            "error": "Could not read file"
         }
 
+    return {
+        "filename": file_path.name,
+        "title": frontmatter.get("title", "Unknown"),
+        "date": frontmatter.get("date", ""),
+        "duration_minutes": frontmatter.get("duration_minutes", 0),
+        "processed": frontmatter.get("processed", False),
+        "attendees": frontmatter.get("attendees", []),
+    }
+
+
+def list_transcript_info(transcripts: list[Path]) -> list[dict[str, Any]]:
+    """Extract info for several transcript files, preserving order."""
+    # Only the frontmatter is needed, so skip reading the transcript bodies
+    frontmatters = map_frontmatter(transcripts, TRANSCRIPT_INFO_KEYS)
+    return [
+        format_transcript_info(file_path, frontmatter)
+        for file_path, frontmatter in zip(transcripts, frontmatters)
+    ]
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -137,13 +149,15 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 "daily_entries_added": stats["daily_entries_added"],
                 "errors": stats["errors"],
             }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=json_dumps(result, indent=True))]
 
         elif name == "list_unprocessed_transcripts":
             older_than_hours = arguments.get("older_than_hours", 0)
-            transcripts = get_unprocessed_transcripts(config, older_than_hours)
-
-            transcript_list = [format_transcript_info(t) for t in transcripts]
+            # Directory scans and file reads run off the event loop
+            transcripts = await asyncio.to_thread(
+                get_unprocessed_transcripts, config, older_than_hours
+            )
+            transcript_list = await asyncio.to_thread(list_transcript_info, transcripts)
 
             result = {
                 "status": "success",
@@ -151,14 +165,14 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 "older_than_hours": older_than_hours,
                 "transcripts": transcript_list,
             }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=json_dumps(result, indent=True))]
 
         elif name == "get_transcript":
             filename = arguments.get("filename")
             if not filename:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"status": "error", "message": "filename is required"})
+                    text=json_dumps({"status": "error", "message": "filename is required"})
                 )]
 
             transcripts_dir = config["obsidian_vault"] / config["transcripts_folder"]
@@ -167,13 +181,13 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             if not file_path.exists():
                 return [TextContent(
                     type="text",
-                    text=json.dumps({
+                    text=json_dumps({
                         "status": "error",
                         "message": f"Transcript not found: {filename}"
                     })
                 )]
 
-            content = file_path.read_text()
+            content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
             frontmatter, body = parse_frontmatter(content)
 
             result = {
@@ -182,7 +196,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 "frontmatter": frontmatter,
                 "content": body,
             }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=json_dumps(result, indent=True))]
 
         elif name == "get_granola_cache_info":
             cache = load_granola_cache(config["granola_cache"])
@@ -194,19 +208,19 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 "transcripts_count": len(cache.get("transcripts", {})),
                 "has_events": len(cache.get("events", [])) > 0,
             }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=json_dumps(result, indent=True))]
 
         else:
             return [TextContent(
                 type="text",
-                text=json.dumps({"status": "error", "message": f"Unknown tool: {name}"})
+                text=json_dumps({"status": "error", "message": f"Unknown tool: {name}"})
             )]
 
     except Exception as e:
         logger.error(f"Error executing tool {name}: {e}")
         return [TextContent(
             type="text",
-            text=json.dumps({"status": "error", "message": str(e)})
+            text=json_dumps({"status": "error", "message": str(e)})
         )]
 
 
@@ -223,5 +237,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -9,14 +9,19 @@ Analyzes transcripts to:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from anthropic import Anthropic
 from dotenv import load_dotenv
 
 from utils import (
@@ -25,24 +30,74 @@ from utils import (
     parse_frontmatter,
     format_frontmatter,
     get_unprocessed_transcripts,
+    atomic_write_bytes,
+    json_dumps,
+    json_loads,
 )
 
+# anthropic pulls in httpx and pydantic, so it is imported in create_client()
+# only once there is work to do
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
 logger = setup_logging(__name__)
 
+# Static analysis instructions, sent as the cacheable system prompt
+ANALYSIS_INSTRUCTIONS = """You analyze meeting transcripts and extract structured information.
 
-def load_api_key() -> str:
-    """Load Anthropic API key from environment."""
-    # Try ~/.config/granola-sync/.env first
-    env_path = Path.home() / ".config" / "granola-sync" / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
+Return a JSON object with:
+
+1. "action_items": List of specific action items mentioned (tasks someone needs to do).
+   - Only include concrete, actionable items
+   - Format: "Person: Task" or just "Task" if person unclear
+   - Maximum 10 items
+
+2. "project_updates": List of objects for relevant projects from the index.
+   - Match based on keywords in the projects index
+   - Each object: {"project": "Project Name", "file": "path/to/file.md", "summary": "2-3 bullet points of relevant discussion"}
+   - Only include if there's meaningful content for that project
+   - Maximum 3 projects
+
+3. "summary": A brief 3-5 bullet point summary of the meeting (for daily notes).
+
+Return ONLY valid JSON, no markdown formatting or explanation."""
+
+# End of the daily file's Work section: a rule or the next heading
+_NEXT_SECTION_RE = re.compile(r"\n---\n|\n## ")
+
+# Claude model used unless config sets "model"
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+
+# Seconds between status checks while a Message Batch is running
+BATCH_POLL_SECONDS = 30
+
+# Saved analyses, keyed by a hash of everything sent to Claude
+ANALYSIS_CACHE_DIR = Path.home() / ".cache" / "granola-sync" / "analysis"
+DEFAULT_ANALYSIS_CACHE_TTL_HOURS = 24 * 30
 
-    # Also try local .env
-    local_env = Path(__file__).parent / ".env"
-    if local_env.exists():
-        load_dotenv(local_env)
+# Serializes read-modify-write of shared daily and project files across threads
+_VAULT_WRITE_LOCK = threading.Lock()
 
+# Claude requests in flight at once unless config sets "concurrency"
+DEFAULT_CONCURRENCY = 8
+
+
+def load_api_key() -> str:
+    """Load Anthropic API key from the environment or the first .env that sets it."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
+
+    # Try ~/.config/granola-sync/.env first, then a local .env
+    env_paths = (
+        Path.home() / ".config" / "granola-sync" / ".env",
+        Path(__file__).parent / ".env",
+    )
+    for env_path in env_paths:
+        if api_key:
+            break
+        if env_path.exists():
+            load_dotenv(env_path)
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+
     if not api_key:
         logger.error("ANTHROPIC_API_KEY not found. Set it in ~/.config/granola-sync/.env")
         sys.exit(1)
@@ -50,97 +105,152 @@ def load_api_key() -> str:
     return api_key
 
 
+def create_client(api_key: str) -> "AsyncAnthropic":
+    """Create the Claude client, on aiohttp when anthropic[aiohttp] is installed."""
+    from anthropic import AsyncAnthropic
+
+    # aiohttp pools connections better than the default httpx transport under
+    # many concurrent requests. httpx_aiohttp is what the extra installs; a
+    # bare aiohttp (often present transitively) is not enough.
+    try:
+        import httpx_aiohttp  # noqa: F401
+        from anthropic import DefaultAioHttpClient
+    except ImportError:
+        return AsyncAnthropic(api_key=api_key)
+    return AsyncAnthropic(api_key=api_key, http_client=DefaultAioHttpClient())
+
+
 def load_projects_index(config: dict) -> str:
     """Load the projects index file for routing context."""
     index_path = config["obsidian_vault"] / config["projects_index"]
     if index_path.exists():
-        return index_path.read_text()
+        return index_path.read_text(encoding="utf-8")
     return ""
 
 
-def update_frontmatter(content: str, updates: dict) -> str:
-    """Update frontmatter values in markdown content."""
-    frontmatter, body = parse_frontmatter(content)
-    if not frontmatter and not content.startswith("---"):
-        return content
-
-    frontmatter.update(updates)
-    return format_frontmatter(frontmatter) + "\n" + body
-
-
 def extract_transcript_section(content: str) -> str:
     """Extract the transcript section from markdown content."""
-    if "## Transcript" in content:
-        parts = content.split("## Transcript", 1)
-        if len(parts) == 2:
-            return parts[1].strip()
-    return content
+    _, sep, transcript = content.partition("## Transcript")
+    return transcript.strip() if sep else content
 
 
-def analyze_transcript(
-    client: Anthropic,
+@lru_cache(maxsize=4)
+def build_system_prompt(projects_index: str) -> str:
+    """Build the static system prompt once per projects index."""
+    return f"{ANALYSIS_INSTRUCTIONS}\n\n## Projects Index (for routing)\n{projects_index}"
+
+
+def build_analysis_request(
     transcript: str,
     title: str,
     projects_index: str,
     model: str
 ) -> dict:
-    """
-    Use Claude to analyze a transcript.
-
-    Returns:
-        {
-            "action_items": ["item1", "item2"],
-            "project_updates": [
-                {"project": "MMM", "file": "1-projects/mmm/context.md", "summary": "..."}
-            ],
-            "summary": "Brief meeting summary if notes were missing"
-        }
-    """
+    """Build the Messages API parameters for analyzing one transcript."""
+    # Instructions and projects index are identical for every transcript in a
+    # run, so they go in a cached system prompt ahead of the per-meeting content
+    system = [{
+        "type": "text",
+        "text": build_system_prompt(projects_index),
+        "cache_control": {"type": "ephemeral"},
+    }]
+
+    # Limit transcript length to avoid token limits
     prompt = f"""Analyze this meeting transcript and extract structured information.
 
 Meeting Title: {title}
 
-## Projects Index (for routing)
-{projects_index}
-
 ## Transcript
-{transcript[:15000]}  # Limit to avoid token limits
+{transcript[:15000]}"""
 
----
+    return {
+        "model": model,
+        "max_tokens": 2000,
+        "system": system,
+        "messages": [{"role": "user", "content": prompt}],
+    }
 
-Please analyze and return a JSON object with:
 
-1. "action_items": List of specific action items mentioned (tasks someone needs to do).
-   - Only include concrete, actionable items
-   - Format: "Person: Task" or just "Task" if person unclear
-   - Maximum 10 items
+def parse_analysis(response_text: str) -> dict:
+    """Parse Claude's JSON analysis, tolerating a markdown code fence."""
+    response_text = response_text.strip()
 
-2. "project_updates": List of objects for relevant projects from the index.
-   - Match based on keywords in the projects index
-   - Each object: {{"project": "Project Name", "file": "path/to/file.md", "summary": "2-3 bullet points of relevant discussion"}}
-   - Only include if there's meaningful content for that project
-   - Maximum 3 projects
+    # Try to extract JSON if wrapped in markdown
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0]
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0]
 
-3. "summary": A brief 3-5 bullet point summary of the meeting (for daily notes).
+    return json_loads(response_text)
 
-Return ONLY valid JSON, no markdown formatting or explanation."""
 
+def get_analysis_cache_path(request: dict) -> Path:
+    """Get the cache file for an analysis request's exact inputs."""
+    key = json.dumps(request, sort_keys=True).encode()
+    return ANALYSIS_CACHE_DIR / f"{hashlib.sha256(key).hexdigest()}.json"
+
+
+def load_cached_analysis(request: dict, ttl_hours: float) -> dict | None:
+    """Return a saved analysis for this request if one is younger than ttl_hours."""
+    if ttl_hours <= 0:
+        return None
+
+    cache_path = get_analysis_cache_path(request)
     try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        if time.time() - cache_path.stat().st_mtime > ttl_hours * 3600:
+            return None
+        return json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
 
-        response_text = response.content[0].text.strip()
+def save_cached_analysis(request: dict, analysis: dict, ttl_hours: float) -> None:
+    """Save an analysis so re-runs on the same transcript skip the API call."""
+    if ttl_hours <= 0:
+        return
+
+    cache_path = get_analysis_cache_path(request)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(cache_path, json_dumps(analysis).encode())
+    except OSError as e:
+        logger.warning(f"Could not cache analysis: {e}")
 
-        # Try to extract JSON if wrapped in markdown
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
 
-        return json.loads(response_text)
+async def analyze_transcript(
+    client: "AsyncAnthropic",
+    transcript: str,
+    title: str,
+    projects_index: str,
+    model: str,
+    cache_ttl_hours: float = 0
+) -> dict:
+    """
+    Use Claude to analyze a transcript.
+
+    With cache_ttl_hours > 0, an analysis saved for identical inputs within
+    that window is returned without calling the API.
+
+    Returns:
+        {
+            "action_items": ["item1", "item2"],
+            "project_updates": [
+                {"project": "MMM", "file": "1-projects/mmm/context.md", "summary": "..."}
+            ],
+            "summary": "Brief meeting summary if notes were missing"
+        }
+    """
+    request = build_analysis_request(transcript, title, projects_index, model)
+    cached = load_cached_analysis(request, cache_ttl_hours)
+    if cached is not None:
+        logger.debug(f"Using cached analysis for: {title}")
+        return cached
+
+    try:
+        response = await client.messages.create(**request)
+        analysis = parse_analysis(response.content[0].text)
+        save_cached_analysis(request, analysis, cache_ttl_hours)
+        return analysis
 
     except Exception as e:
         logger.error(f"Claude API error: {e}")
@@ -173,7 +283,7 @@ def add_action_items_to_daily(
         logger.warning(f"Daily file not found: {daily_path}")
         return False
 
-    content = daily_path.read_text()
+    content = daily_path.read_text(encoding="utf-8")
 
     # Format action items
     items_text = f"\n*From {meeting_title}:*\n"
@@ -192,7 +302,7 @@ def add_action_items_to_daily(
         if len(parts) == 2:
             # Find next section
             after = parts[1]
-            next_section = re.search(r'\n---\n|\n## ', after)
+            next_section = _NEXT_SECTION_RE.search(after)
 
             if next_section:
                 insert_pos = next_section.start()
@@ -201,7 +311,7 @@ def add_action_items_to_daily(
                 new_after = after.rstrip() + items_text + "\n"
 
             content = parts[0] + "## Work" + new_after
-            daily_path.write_text(content)
+            daily_path.write_text(content, encoding="utf-8")
             logger.info(f"Added {len(action_items)} action items to {daily_path.name}")
             return True
 
@@ -221,7 +331,7 @@ def update_project_file(
         logger.warning(f"Project file not found: {file_path}")
         return False
 
-    content = file_path.read_text()
+    content = file_path.read_text(encoding="utf-8")
 
     # Create update entry
     entry = f"""
@@ -234,106 +344,260 @@ def update_project_file(
         logger.debug(f"Update already in project file: {file_path.name}")
         return False
 
-    # Try to add under a "Meeting Notes" or "Updates" section
-    # Or append before the last section
-    if "## Meeting Notes" in content:
-        content = content.replace("## Meeting Notes", f"## Meeting Notes\n{entry}")
-    elif "## Updates" in content:
-        content = content.replace("## Updates", f"## Updates\n{entry}")
+    # Try to add under the first "Meeting Notes" or "Updates" heading
+    # Or append a new section at the end
+    for marker in ("## Meeting Notes", "## Updates"):
+        idx = content.find(marker)
+        if idx != -1:
+            insert_at = idx + len(marker)
+            content = content[:insert_at] + "\n" + entry + content[insert_at:]
+            break
     else:
         # Append to end
         content = content.rstrip() + f"\n\n## Meeting Notes\n{entry}"
 
-    file_path.write_text(content)
+    file_path.write_text(content, encoding="utf-8")
     logger.info(f"Added update to project file: {file_path.name}")
     return True
 
 
-def update_notes_section(transcript_path: Path, summary: str) -> bool:
-    """Update the Notes section if it's empty."""
-    content = transcript_path.read_text()
+def update_notes_section(body: str, summary: str) -> tuple[str, bool]:
+    """
+    Fill the Notes section placeholder with summary if it's empty.
 
+    Returns the updated body and whether it changed.
+    """
     # Check if notes section is empty/placeholder
-    if "*No AI notes available" not in content and "*Notes pending*" not in content:
-        return False
+    if "*No AI notes available" not in body and "*Notes pending*" not in body:
+        return body, False
 
     if not summary:
-        return False
+        return body, False
 
     # Replace placeholder with actual summary
-    if "*No AI notes available - will be generated during processing*" in content:
-        content = content.replace(
+    if "*No AI notes available - will be generated during processing*" in body:
+        body = body.replace(
             "*No AI notes available - will be generated during processing*",
             summary
         )
-        transcript_path.write_text(content)
-        logger.info(f"Updated notes in: {transcript_path.name}")
-        return True
+        return body, True
 
-    return False
+    return body, False
 
 
-def process_transcript(transcript_path: Path, config: dict, client: Anthropic) -> bool:
-    """Process a single transcript file."""
+def read_transcript(transcript_path: Path) -> tuple[dict, str, str] | None:
+    """
+    Read a transcript file that still needs processing.
+
+    Returns (frontmatter, body, transcript_text), or None if the file is
+    already processed or has too little transcript to analyze.
+    """
     logger.info(f"Processing: {transcript_path.name}")
 
-    content = transcript_path.read_text()
+    content = transcript_path.read_text(encoding="utf-8")
     frontmatter, body = parse_frontmatter(content)
 
+    # Without parsed frontmatter the file can't be marked processed, so
+    # analyzing it would repeat on every run
+    if not frontmatter:
+        logger.warning(f"Skipping transcript with unreadable frontmatter: {transcript_path.name}")
+        return None
+
     # Skip if already processed
     if frontmatter.get("processed", False):
         logger.debug(f"Already processed: {transcript_path.name}")
-        return False
-
-    title = frontmatter.get("title", "Unknown Meeting")
-    meeting_date = frontmatter.get("date", "")
+        return None
 
     # Extract transcript text
     transcript_text = extract_transcript_section(body)
 
     if not transcript_text or len(transcript_text) < 100:
         logger.warning(f"Transcript too short: {transcript_path.name}")
-        return False
+        return None
 
-    # Load projects index for routing
-    projects_index = load_projects_index(config)
+    return frontmatter, body, transcript_text
 
-    # Analyze with Claude
-    model = config.get("model", "claude-sonnet-4-20250514")
-    analysis = analyze_transcript(client, transcript_text, title, projects_index, model)
+
+def apply_analysis(
+    transcript_path: Path,
+    frontmatter: dict,
+    body: str,
+    analysis: dict,
+    config: dict
+) -> bool:
+    """
+    Apply Claude's analysis to the vault and mark the transcript processed.
+
+    Safe to call from several threads at once; updates to the shared daily
+    and project files are serialized.
+    """
+    title = frontmatter.get("title", "Unknown Meeting")
+    # YAML loads unquoted dates (as written by sync) as date objects
+    meeting_date = str(frontmatter.get("date", ""))
 
     # Process results
     changes_made = False
 
-    # 1. Add action items to daily file
-    if analysis.get("action_items"):
-        if add_action_items_to_daily(
-            analysis["action_items"],
-            meeting_date,
-            title,
-            config
-        ):
-            changes_made = True
-
-    # 2. Update project files
-    for project_update in analysis.get("project_updates", []):
-        if update_project_file(project_update, meeting_date, title, config):
-            changes_made = True
+    # Daily and project files are shared between transcripts
+    with _VAULT_WRITE_LOCK:
+        # 1. Add action items to daily file
+        if analysis.get("action_items"):
+            if add_action_items_to_daily(
+                analysis["action_items"],
+                meeting_date,
+                title,
+                config
+            ):
+                changes_made = True
+
+        # 2. Update project files
+        for project_update in analysis.get("project_updates", []):
+            if update_project_file(project_update, meeting_date, title, config):
+                changes_made = True
 
     # 3. Update notes section if empty
     if analysis.get("summary"):
         summary_text = "\n".join(f"- {line}" for line in analysis["summary"].split("\n") if line.strip())
-        if update_notes_section(transcript_path, summary_text):
+        body, notes_updated = update_notes_section(body, summary_text)
+        if notes_updated:
+            logger.info(f"Updated notes in: {transcript_path.name}")
             changes_made = True
 
-    # Mark as processed
-    updated_content = update_frontmatter(content, {"processed": True})
-    transcript_path.write_text(updated_content)
+    # Mark as processed, writing the notes and frontmatter back in one pass
+    frontmatter["processed"] = True
+    content = format_frontmatter(frontmatter) + "\n" + body
+    transcript_path.write_text(content, encoding="utf-8")
     logger.info(f"Marked as processed: {transcript_path.name}")
 
     return True
 
 
+async def process_transcript(
+    transcript_path: Path,
+    config: dict,
+    client: "AsyncAnthropic",
+    projects_index: str
+) -> bool:
+    """
+    Process a single transcript file.
+
+    File I/O runs in worker threads so slow vault storage doesn't stall other
+    in-flight Claude requests.
+    """
+    loaded = await asyncio.to_thread(read_transcript, transcript_path)
+    if loaded is None:
+        return False
+    frontmatter, body, transcript_text = loaded
+
+    # Analyze with Claude
+    title = frontmatter.get("title", "Unknown Meeting")
+    model = config.get("model", DEFAULT_MODEL)
+    cache_ttl_hours = config.get("analysis_cache_ttl_hours", DEFAULT_ANALYSIS_CACHE_TTL_HOURS)
+    analysis = await analyze_transcript(
+        client, transcript_text, title, projects_index, model, cache_ttl_hours
+    )
+
+    return await asyncio.to_thread(
+        apply_analysis, transcript_path, frontmatter, body, analysis, config
+    )
+
+
+async def process_transcripts(
+    transcripts: list[Path],
+    config: dict,
+    client: "AsyncAnthropic",
+    projects_index: str
+) -> int:
+    """
+    Process transcripts concurrently, bounded by config["concurrency"].
+    Returns the number of transcripts processed.
+    """
+    semaphore = asyncio.Semaphore(config.get("concurrency", DEFAULT_CONCURRENCY))
+
+    async def process_one(transcript_path: Path) -> bool:
+        async with semaphore:
+            try:
+                return await process_transcript(transcript_path, config, client, projects_index)
+            except Exception as e:
+                logger.error(f"Error processing {transcript_path.name}: {e}")
+                return False
+
+    results = await asyncio.gather(*(process_one(t) for t in transcripts))
+    return sum(results)
+
+
+async def process_transcripts_batch(
+    transcripts: list[Path],
+    config: dict,
+    client: "AsyncAnthropic",
+    projects_index: str
+) -> int:
+    """
+    Process transcripts through a single Message Batches request.
+
+    Batches are billed at half price but may take minutes to hours to finish,
+    so each transcript is re-read when its result arrives to keep edits made
+    in the meantime. Transcripts whose request fails stay unprocessed so a
+    later run retries them. Returns the number of transcripts processed.
+    """
+    model = config.get("model", DEFAULT_MODEL)
+    cache_ttl_hours = config.get("analysis_cache_ttl_hours", DEFAULT_ANALYSIS_CACHE_TTL_HOURS)
+    processed = 0
+    pending = {}
+    requests = []
+
+    for i, transcript_path in enumerate(transcripts):
+        loaded = read_transcript(transcript_path)
+        if loaded is None:
+            continue
+        frontmatter, body, transcript_text = loaded
+
+        title = frontmatter.get("title", "Unknown Meeting")
+        request = build_analysis_request(transcript_text, title, projects_index, model)
+
+        # Transcripts analyzed on an earlier run are applied without a request
+        cached = load_cached_analysis(request, cache_ttl_hours)
+        if cached is not None:
+            if apply_analysis(transcript_path, frontmatter, body, cached, config):
+                processed += 1
+            continue
+
+        custom_id = f"transcript-{i}"
+        pending[custom_id] = (transcript_path, request)
+        requests.append({"custom_id": custom_id, "params": request})
+
+    if not requests:
+        return processed
+
+    batch = await client.messages.batches.create(requests=requests)
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} transcripts")
+
+    while batch.processing_status != "ended":
+        await asyncio.sleep(config.get("batch_poll_seconds", BATCH_POLL_SECONDS))
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    async for entry in await client.messages.batches.results(batch.id):
+        transcript_path, request = pending[entry.custom_id]
+        if entry.result.type != "succeeded":
+            logger.error(f"Batch request {entry.result.type} for {transcript_path.name}")
+            continue
+
+        try:
+            analysis = parse_analysis(entry.result.message.content[0].text)
+            save_cached_analysis(request, analysis, cache_ttl_hours)
+            # The file may have been edited or processed while the batch ran
+            loaded = read_transcript(transcript_path)
+            if loaded is None:
+                continue
+            frontmatter, body, _ = loaded
+            if apply_analysis(transcript_path, frontmatter, body, analysis, config):
+                processed += 1
+        except Exception as e:
+            logger.error(f"Error processing {transcript_path.name}: {e}")
+
+    return processed
+
+
 def main():
     parser = argparse.ArgumentParser(description="Process meeting transcripts with Claude")
     parser.add_argument(
@@ -356,6 +620,11 @@ def main():
         action="store_true",
         help="Show what would be processed without making changes"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit through the Message Batches API (half price, may take hours)"
+    )
 
     args = parser.parse_args()
 
@@ -363,8 +632,6 @@ def main():
     logger.info("Starting transcript processing")
 
     config = load_config()
-    api_key = load_api_key()
-    client = Anthropic(api_key=api_key)
 
     # Determine which transcripts to process
     if args.file:
@@ -392,14 +659,20 @@ def main():
             logger.info(f"  - {t.name}")
         return
 
-    # Process each transcript
-    processed = 0
-    for transcript_path in transcripts:
-        try:
-            if process_transcript(transcript_path, config, client):
-                processed += 1
-        except Exception as e:
-            logger.error(f"Error processing {transcript_path.name}: {e}")
+    api_key = load_api_key()
+
+    # Projects index is the same for every transcript, so read it once
+    projects_index = load_projects_index(config)
+
+    async def run() -> int:
+        # The client's connection pool must be opened and closed on this loop
+        async with create_client(api_key) as client:
+            if args.batch:
+                return await process_transcripts_batch(transcripts, config, client, projects_index)
+            # Process transcripts concurrently
+            return await process_transcripts(transcripts, config, client, projects_index)
+
+    processed = asyncio.run(run())
 
     logger.info(f"Processed {processed}/{len(transcripts)} transcripts")
     logger.info("=" * 50)
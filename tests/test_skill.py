@@ -5,64 +5,117 @@ Tests for the Granola Sync skill and MCP server.
 import json
 import pytest
 import tempfile
+import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+def _granola_cache_json(documents: dict, transcripts: dict) -> str:
+    """Serialize a Granola cache file, whose "cache" field is itself JSON."""
+    return json.dumps({
+        "cache": json.dumps({
+            "state": {
+                "documents": documents,
+                "transcripts": transcripts,
+                "events": []
+            }
+        })
+    })
+
+
+# Cache file contents are built once and shared by every fixture that needs them
+EMPTY_CACHE_JSON = _granola_cache_json({}, {})
+
+NEW_MEETING_CACHE_JSON = _granola_cache_json(
+    documents={
+        "doc1": {
+            "id": "doc1",
+            "title": "New Meeting",
+            "createdAt": "2026-01-16T10:00:00Z"
+        }
+    },
+    transcripts={
+        "doc1": [
+            {"text": "Hello everyone", "timestamp": 1000}
+        ]
+    },
+)
+
+STANDUP_CACHE_JSON = _granola_cache_json(
+    documents={
+        "doc1": {
+            "id": "doc1",
+            "title": "Team Standup",
+            "createdAt": "2026-01-15T10:00:00Z",
+            "notes_markdown": "## Action Items\n- Review PR"
+        }
+    },
+    transcripts={
+        "doc1": [
+            {"text": "Good morning everyone", "timestamp": 1000},
+            {"text": "Let's start the standup", "timestamp": 2000}
+        ]
+    },
+)
+
 
 # ============================================================================
 # SKILL.md Format Tests
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def skill_path():
+    return Path(__file__).parent.parent / "skills" / "sync" / "SKILL.md"
+
+
+@pytest.fixture(scope="session")
+def skill_parsed(skill_path):
+    """Read and split SKILL.md once, returning (content, frontmatter, body)."""
+    content = skill_path.read_text(encoding="utf-8")
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return content, None, ""
+    return content, yaml.load(parts[1].strip(), Loader=_SafeLoader), parts[2].strip()
+
+
 class TestSkillFormat:
     """Test that SKILL.md follows the correct format."""
 
-    @pytest.fixture
-    def skill_path(self):
-        return Path(__file__).parent.parent / "skills" / "sync" / "SKILL.md"
-
     def test_skill_file_exists(self, skill_path):
         """SKILL.md should exist in skills/sync/."""
         assert skill_path.exists(), f"SKILL.md not found at {skill_path}"
 
-    def test_skill_has_frontmatter(self, skill_path):
+    def test_skill_has_frontmatter(self, skill_parsed):
         """SKILL.md should have valid YAML frontmatter."""
-        content = skill_path.read_text()
+        content, frontmatter, _ = skill_parsed
 
         assert content.startswith("---"), "SKILL.md should start with ---"
-
-        # Find the closing ---
-        parts = content.split("---", 2)
-        assert len(parts) >= 3, "SKILL.md should have opening and closing ---"
-
-        frontmatter_yaml = parts[1].strip()
-        frontmatter = yaml.safe_load(frontmatter_yaml)
-
+        assert frontmatter is not None, "SKILL.md should have opening and closing ---"
         assert isinstance(frontmatter, dict), "Frontmatter should be a dict"
 
-    def test_skill_has_required_fields(self, skill_path):
+    def test_skill_has_required_fields(self, skill_parsed):
         """SKILL.md frontmatter should have name and description."""
-        content = skill_path.read_text()
-        parts = content.split("---", 2)
-        frontmatter = yaml.safe_load(parts[1].strip())
+        _, frontmatter, _ = skill_parsed
 
         assert "name" in frontmatter, "Frontmatter must have 'name'"
         assert "description" in frontmatter, "Frontmatter must have 'description'"
 
-    def test_skill_name_is_sync(self, skill_path):
+    def test_skill_name_is_sync(self, skill_parsed):
         """Skill name should be 'sync'."""
-        content = skill_path.read_text()
-        parts = content.split("---", 2)
-        frontmatter = yaml.safe_load(parts[1].strip())
+        _, frontmatter, _ = skill_parsed
 
         assert frontmatter["name"] == "sync"
 
-    def test_skill_has_body_content(self, skill_path):
+    def test_skill_has_body_content(self, skill_parsed):
         """SKILL.md should have instructions in the body."""
-        content = skill_path.read_text()
-        parts = content.split("---", 2)
-        body = parts[2].strip()
+        _, _, body = skill_parsed
 
         assert len(body) > 0, "SKILL.md should have body content"
         assert "sync_transcripts" in body, "Body should mention sync_transcripts tool"
@@ -84,16 +137,7 @@ class TestMCPServerTools:
         transcripts_path.mkdir(parents=True)
 
         cache_path = tmp_path / "granola_cache.json"
-        cache_data = {
-            "cache": json.dumps({
-                "state": {
-                    "documents": {},
-                    "transcripts": {},
-                    "events": []
-                }
-            })
-        }
-        cache_path.write_text(json.dumps(cache_data))
+        cache_path.write_text(EMPTY_CACHE_JSON, encoding="utf-8")
 
         return {
             "granola_cache": cache_path,
@@ -178,29 +222,10 @@ This is a test meeting.
 Alice: Hello
 Bob: Hi there
 """
-        (transcripts_path / "2026-01-15 - Test Meeting.md").write_text(transcript_content)
+        (transcripts_path / "2026-01-15 - Test Meeting.md").write_text(transcript_content, encoding="utf-8")
 
         cache_path = tmp_path / "granola_cache.json"
-        cache_data = {
-            "cache": json.dumps({
-                "state": {
-                    "documents": {
-                        "doc1": {
-                            "id": "doc1",
-                            "title": "New Meeting",
-                            "createdAt": "2026-01-16T10:00:00Z"
-                        }
-                    },
-                    "transcripts": {
-                        "doc1": [
-                            {"text": "Hello everyone", "timestamp": 1000}
-                        ]
-                    },
-                    "events": []
-                }
-            })
-        }
-        cache_path.write_text(json.dumps(cache_data))
+        cache_path.write_text(NEW_MEETING_CACHE_JSON, encoding="utf-8")
 
         config_path = tmp_path / "config.yaml"
         config_yaml = f"""
@@ -209,7 +234,7 @@ obsidian_vault: {vault_path}
 transcripts_folder: Meetings/Transcripts
 daily_folder: Daily
 """
-        config_path.write_text(config_yaml)
+        config_path.write_text(config_yaml, encoding="utf-8")
 
         return {
             "granola_cache": cache_path,
@@ -251,6 +276,43 @@ daily_folder: Daily
         assert data["frontmatter"]["title"] == "Test Meeting"
         assert "Alice" in data["frontmatter"]["attendees"]
 
+    @pytest.mark.asyncio
+    async def test_get_transcript_unquoted_date(self, mock_config):
+        """Dates parsed by YAML should serialize as ISO strings."""
+        from mcp_server import call_tool
+
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+        (transcripts_dir / "dated.md").write_text(
+            "---\ntitle: Dated\ndate: 2026-01-15\n---\n\n## Transcript\n",
+            encoding="utf-8",
+        )
+
+        with patch("mcp_server.load_config", return_value=mock_config):
+            result = await call_tool("get_transcript", {"filename": "dated.md"})
+
+        data = json.loads(result[0].text)
+        assert data["status"] == "success"
+        assert data["frontmatter"]["date"] == "2026-01-15"
+
+    @pytest.mark.asyncio
+    async def test_list_unprocessed_transcripts(self, mock_config):
+        """list_unprocessed_transcripts should report frontmatter metadata."""
+        from mcp_server import call_tool
+
+        with patch("mcp_server.load_config", return_value=mock_config):
+            result = await call_tool("list_unprocessed_transcripts", {})
+
+        data = json.loads(result[0].text)
+        assert data["count"] == 1
+        assert data["transcripts"][0] == {
+            "filename": "2026-01-15 - Test Meeting.md",
+            "title": "Test Meeting",
+            "date": "2026-01-15",
+            "duration_minutes": 30,
+            "processed": False,
+            "attendees": ["Alice", "Bob"],
+        }
+
     @pytest.mark.asyncio
     async def test_get_transcript_not_found(self, mock_config):
         """get_transcript should return error for missing file."""
@@ -308,28 +370,7 @@ class TestSyncTranscripts:
         daily_path.mkdir()
 
         cache_path = tmp_path / "granola_cache.json"
-        cache_data = {
-            "cache": json.dumps({
-                "state": {
-                    "documents": {
-                        "doc1": {
-                            "id": "doc1",
-                            "title": "Team Standup",
-                            "createdAt": "2026-01-15T10:00:00Z",
-                            "notes_markdown": "## Action Items\n- Review PR"
-                        }
-                    },
-                    "transcripts": {
-                        "doc1": [
-                            {"text": "Good morning everyone", "timestamp": 1000},
-                            {"text": "Let's start the standup", "timestamp": 2000}
-                        ]
-                    },
-                    "events": []
-                }
-            })
-        }
-        cache_path.write_text(json.dumps(cache_data))
+        cache_path.write_text(STANDUP_CACHE_JSON, encoding="utf-8")
 
         return {
             "granola_cache": cache_path,
@@ -366,6 +407,207 @@ class TestSyncTranscripts:
         assert stats2["transcripts_created"] == 0
         assert stats2["transcripts_skipped"] == 1
 
+    def test_sync_writes_parseable_frontmatter(self, mock_config):
+        """Generated transcript frontmatter should round-trip through YAML."""
+        from granola_sync import sync_transcripts
+        from utils import parse_frontmatter
+
+        sync_transcripts(mock_config)
+
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+        frontmatter, body = parse_frontmatter(next(transcripts_dir.glob("*.md")).read_text(encoding="utf-8"))
+
+        assert frontmatter["title"] == "Team Standup"
+        assert frontmatter["granola_id"] == "doc1"
+        assert frontmatter["processed"] is False
+        assert body.startswith("## Notes")
+
+    def test_generate_transcript_file_recognizes_quoted_id(self, mock_config):
+        """An id written quoted (e.g. all digits) should still match on the next run."""
+        from granola_sync import generate_transcript_file
+
+        doc = {"title": "M", "createdAt": "2026-01-15T10:00:00Z"}
+        entries = [{"text": "Hello", "timestamp": 1000}]
+
+        first_path, created, _, _ = generate_transcript_file("12345", doc, entries, mock_config)
+        second_path, created_again, _, _ = generate_transcript_file("12345", doc, entries, mock_config)
+
+        assert created
+        assert not created_again
+        assert second_path == first_path
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+        assert len(list(transcripts_dir.glob("*.md"))) == 1
+
+    def test_add_meeting_to_daily_sees_external_edits(self, mock_config):
+        """Cached daily content should be dropped when the file changes on disk."""
+        import os
+        from datetime import datetime
+        from granola_sync import add_meeting_to_daily, get_daily_file_path
+
+        meeting_dt = datetime(2026, 1, 15, 10, 0)
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+
+        add_meeting_to_daily(meeting_dt, "First", "", transcripts_dir / "first.md", mock_config)
+        daily_path = get_daily_file_path(meeting_dt, mock_config)
+        daily_path.write_text(daily_path.read_text(encoding="utf-8") + "\nEdited by hand\n", encoding="utf-8")
+        os.utime(daily_path, ns=(0, 0))
+        add_meeting_to_daily(meeting_dt, "Second", "", transcripts_dir / "second.md", mock_config)
+
+        content = daily_path.read_text(encoding="utf-8")
+        assert "Edited by hand" in content
+        assert "### First" in content
+        assert "### Second" in content
+
+    def test_sync_releases_daily_cache(self, mock_config):
+        """Daily file contents shouldn't be kept once a sync finishes."""
+        import granola_sync
+
+        stats = granola_sync.sync_transcripts(mock_config)
+
+        assert stats["daily_entries_added"] == 1
+        assert granola_sync._daily_cache == {}
+
+    def test_load_granola_cache_reparses_after_change(self, mock_config):
+        """Cached cache contents should be reused until the file changes."""
+        from granola_sync import load_granola_cache
+
+        cache_path = mock_config["granola_cache"]
+        first = load_granola_cache(cache_path)
+        assert load_granola_cache(cache_path) is first
+
+        cache_path.write_text(EMPTY_CACHE_JSON, encoding="utf-8")
+        assert load_granola_cache(cache_path)["documents"] == {}
+
+    def test_sync_records_index_and_recreates_deleted(self, mock_config):
+        """Synced ids go in the index; deleted transcripts are re-created."""
+        from granola_sync import sync_transcripts
+        from utils import load_sync_index
+
+        sync_transcripts(mock_config)
+        index = load_sync_index(mock_config)
+        assert set(index) == {"doc1"}
+
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+        (transcripts_dir / index["doc1"]).unlink()
+
+        stats = sync_transcripts(mock_config)
+        assert stats["transcripts_created"] == 1
+
+    def test_sync_rebuilds_missing_index(self, mock_config):
+        """A deleted index should be rebuilt from transcript frontmatter."""
+        from granola_sync import sync_transcripts
+        from utils import get_sync_index_path, load_sync_index
+
+        sync_transcripts(mock_config)
+        get_sync_index_path(mock_config).unlink()
+
+        stats = sync_transcripts(mock_config)
+        assert stats["transcripts_created"] == 0
+        assert stats["transcripts_skipped"] == 1
+        assert set(load_sync_index(mock_config)) == {"doc1"}
+
+    def test_sync_saves_empty_rebuilt_index(self, mock_config):
+        """A rebuild that finds no synced transcripts should still be saved, so it runs once."""
+        import granola_sync
+        from utils import load_sync_index
+
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+        (transcripts_dir / "Hand written.md").write_text("# Notes\n", encoding="utf-8")
+        mock_config["granola_cache"].write_text(EMPTY_CACHE_JSON, encoding="utf-8")
+
+        with patch("granola_sync.rebuild_sync_index", wraps=granola_sync.rebuild_sync_index) as rebuild:
+            granola_sync.sync_transcripts(mock_config)
+            granola_sync.sync_transcripts(mock_config)
+
+        assert rebuild.call_count == 1
+        assert load_sync_index(mock_config) == {}
+
+    @pytest.mark.parametrize("index_json", ['{"doc1": ["x"], "doc2": 3}', "[1, 2]"])
+    def test_sync_rebuilds_malformed_index(self, mock_config, index_json):
+        """Index entries that aren't id -> filename strings should be ignored, not abort sync."""
+        from granola_sync import sync_transcripts
+        from utils import get_sync_index_path, load_sync_index
+
+        sync_transcripts(mock_config)
+        get_sync_index_path(mock_config).write_text(index_json, encoding="utf-8")
+
+        stats = sync_transcripts(mock_config)
+        assert stats["transcripts_created"] == 0
+        assert stats["transcripts_skipped"] == 1
+        assert set(load_sync_index(mock_config)) == {"doc1"}
+
+    def test_load_sync_index_ignores_unreadable_path(self, mock_config):
+        """An index path that can't be read as a file should load as missing."""
+        from utils import get_sync_index_path, load_sync_index
+
+        get_sync_index_path(mock_config).mkdir()
+
+        assert load_sync_index(mock_config) is None
+
+    def test_atomic_write_bytes_survives_concurrent_writer(self, tmp_path, monkeypatch):
+        """A second writer of the same path mid-write should not clobber the first's temp file."""
+        import os
+        import utils
+
+        path = tmp_path / "daily.md"
+        real_writev = os.writev
+        nested = []
+
+        def writev(fd, buffers):
+            if not nested:
+                nested.append(True)
+                utils.atomic_write_bytes(path, b"other writer")
+            return real_writev(fd, buffers)
+
+        monkeypatch.setattr(utils.os, "writev", writev)
+        utils.atomic_write_bytes(path, [b"first ", b"writer"])
+
+        assert path.read_bytes() == b"first writer"
+        assert [p.name for p in tmp_path.iterdir()] == ["daily.md"]
+
+    def test_atomic_write_bytes_keeps_file_mode(self, tmp_path, monkeypatch):
+        """Rewrites keep the existing mode; new files get the umask-derived default."""
+        import stat
+        import utils
+
+        private = tmp_path / "private.md"
+        private.write_bytes(b"old")
+        private.chmod(0o600)
+        utils.atomic_write_bytes(private, b"new")
+        assert stat.S_IMODE(private.stat().st_mode) == 0o600
+
+        monkeypatch.setattr(utils, "_UMASK", 0o027)
+        fresh = tmp_path / "fresh.md"
+        utils.atomic_write_bytes(fresh, b"new")
+        assert stat.S_IMODE(fresh.stat().st_mode) == 0o640
+
+    def test_sync_parses_meeting_date_once(self, mock_config):
+        """Each document's meeting date should be computed once and reused for its file."""
+        import granola_sync
+
+        with patch("granola_sync.get_meeting_date", wraps=granola_sync.get_meeting_date) as get_date:
+            stats = granola_sync.sync_transcripts(mock_config)
+
+        assert stats["transcripts_created"] == 1
+        assert get_date.call_count == 1
+
+    def test_sync_skips_empty_documents(self, mock_config):
+        """Transcripts whose document is empty or null should be skipped, not synced."""
+        from granola_sync import sync_transcripts
+
+        entries = [{"text": "Hello", "timestamp": 1000}]
+        mock_config["granola_cache"].write_text(
+            _granola_cache_json(documents={"a": {}, "b": None}, transcripts={"a": entries, "b": entries}),
+            encoding="utf-8",
+        )
+
+        stats = sync_transcripts(mock_config)
+
+        assert stats["transcripts_created"] == 0
+        assert stats["errors"] == 0
+        transcripts_dir = mock_config["obsidian_vault"] / mock_config["transcripts_folder"]
+        assert list(transcripts_dir.glob("*.md")) == []
+
     def test_sync_handles_empty_cache(self, tmp_path):
         """sync_transcripts should handle empty cache gracefully."""
         from granola_sync import sync_transcripts
@@ -376,16 +618,7 @@ class TestSyncTranscripts:
         transcripts_path.mkdir(parents=True)
 
         cache_path = tmp_path / "granola_cache.json"
-        cache_data = {
-            "cache": json.dumps({
-                "state": {
-                    "documents": {},
-                    "transcripts": {},
-                    "events": []
-                }
-            })
-        }
-        cache_path.write_text(json.dumps(cache_data))
+        cache_path.write_text(EMPTY_CACHE_JSON, encoding="utf-8")
 
         config = {
             "granola_cache": cache_path,
@@ -399,3 +632,348 @@ class TestSyncTranscripts:
         assert stats["transcripts_created"] == 0
         assert stats["transcripts_skipped"] == 0
         assert stats["errors"] == 0
+
+
+# ============================================================================
+# Frontmatter Parsing Tests
+# ============================================================================
+
+class TestParseFrontmatter:
+    """Test that the fast frontmatter path agrees with a full YAML parse."""
+
+    @pytest.mark.parametrize("frontmatter", [
+        'date: 2026-01-15\ntitle: "Sync: Q1 plan"\nduration_minutes: 45\n'
+        "attendees:\n  - kevin@example.com\n  - Jane Doe\nprocessed: false",
+        "title: Yes\nprocessed: true",
+        "title: Standup # daily\nnotes:",
+        "tags: [a, b]\ntitle: 2026 planning",
+        "title: Sprint\t#42\nprocessed: false",
+        "title: \xa0\nprocessed: false",
+    ])
+    def test_matches_yaml(self, frontmatter):
+        from utils import parse_frontmatter
+
+        parsed, body = parse_frontmatter(f"---\n{frontmatter}\n---\n\nBody")
+
+        assert parsed == yaml.load(frontmatter, Loader=_SafeLoader)
+        assert body == "Body"
+
+    @pytest.mark.parametrize("title", ["a\u2028b", "a\x85b", "x:\ty", "bell\x07"])
+    def test_rejects_what_yaml_rejects(self, title):
+        """Values YAML can't read should not be accepted by the fast path."""
+        from utils import parse_frontmatter
+
+        content = f"---\ntitle: {title}\nprocessed: false\n---\n\nBody"
+
+        assert parse_frontmatter(content) == ({}, content)
+
+    def test_map_frontmatter_keeps_order(self, tmp_path):
+        """Results line up with the input paths; unreadable files give None."""
+        from utils import map_frontmatter
+
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"{i}.md"
+            path.write_text(f"---\ntitle: Meeting {i}\nprocessed: false\n---\n", encoding="utf-8")
+            paths.append(path)
+        paths.insert(5, tmp_path / "missing.md")
+
+        results = map_frontmatter(paths, {"title"})
+
+        assert results[5] is None
+        assert [r["title"] for r in results if r] == [f"Meeting {i}" for i in range(20)]
+
+    def test_fields_match_full_parse(self):
+        """parse_frontmatter_fields should agree with parse_frontmatter, with dates as strings."""
+        from utils import parse_frontmatter_fields
+
+        content = (
+            '---\ndate: 2026-01-15\ntitle: "Sync \\"Q1\\""\nduration_minutes: 45\n'
+            "attendees:\n  - Jane Doe\nprocessed: true\n---\n"
+        )
+
+        assert parse_frontmatter_fields(content, {"date", "title", "duration_minutes", "attendees"}) == {
+            "date": "2026-01-15",
+            "title": 'Sync "Q1"',
+            "duration_minutes": 45,
+            "attendees": ["Jane Doe"],
+        }
+
+    @pytest.mark.parametrize("title", [
+        'Say "hi": intro', "yes", "123", "#general", "it's", "²",
+        "Sprint\t#42", "a\u2028b", "a\x85b", "x:\ty", "bell\x07",
+    ])
+    def test_format_frontmatter_round_trips(self, title):
+        from utils import format_frontmatter, parse_frontmatter
+
+        data = {"title": title, "attendees": [title], "processed": False}
+        content = format_frontmatter(data)
+
+        # Checked against a full YAML parse, which is what Obsidian reads
+        assert yaml.load(content.strip("-\n"), Loader=_SafeLoader) == data
+        assert parse_frontmatter(content + "\n")[0] == data
+
+
+# ============================================================================
+# Unprocessed Transcript Scan Tests
+# ============================================================================
+
+class TestGetUnprocessedTranscripts:
+    """Test scanning the vault for unprocessed transcripts."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        vault_path = tmp_path / "vault"
+        transcripts_path = vault_path / "Meetings" / "Transcripts"
+        transcripts_path.mkdir(parents=True)
+        return {
+            "obsidian_vault": vault_path,
+            "transcripts_folder": "Meetings/Transcripts",
+        }
+
+    def _write(self, config, name, frontmatter, body=""):
+        path = config["obsidian_vault"] / config["transcripts_folder"] / name
+        path.write_text(f"---\n{frontmatter}\n---\n\n{body}", encoding="utf-8")
+        return path
+
+    def test_returns_only_unprocessed(self, config):
+        """Only files flagged processed: false should be returned."""
+        from utils import get_unprocessed_transcripts
+
+        pending = self._write(config, "a.md", "date: 2026-01-15\nprocessed: false")
+        self._write(config, "b.md", "date: 2026-01-15\nprocessed: true")
+
+        assert get_unprocessed_transcripts(config) == [pending]
+
+    def test_ignores_flag_outside_frontmatter(self, config):
+        """A 'processed: false' string in the body should not match."""
+        from utils import get_unprocessed_transcripts
+
+        self._write(
+            config, "a.md", "date: 2026-01-15\nprocessed: true",
+            body="## Transcript\n\nprocessed: false\n"
+        )
+
+        assert get_unprocessed_transcripts(config) == []
+
+    def test_older_than_hours_filters_recent(self, config):
+        """Transcripts newer than the cutoff should be skipped."""
+        from datetime import datetime
+        from utils import get_unprocessed_transcripts
+
+        old = self._write(config, "old.md", "date: 2020-01-01\nprocessed: false")
+        today = datetime.now().strftime("%Y-%m-%d")
+        self._write(config, "new.md", f"date: {today}\nprocessed: false")
+
+        assert get_unprocessed_transcripts(config, 48) == [old]
+
+
+# ============================================================================
+# Transcript Processing Tests
+# ============================================================================
+
+class FakeMessages:
+    """Stand-in for AsyncAnthropic().messages returning a canned analysis."""
+
+    def __init__(self, analysis):
+        self.analysis = analysis
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return MagicMock(content=[MagicMock(text=json.dumps(self.analysis))])
+
+
+class FakeBatches:
+    """Stand-in for AsyncAnthropic().messages.batches that finishes on first poll."""
+
+    def __init__(self, analysis, on_retrieve=None):
+        self.analysis = analysis
+        self.on_retrieve = on_retrieve
+        self.requests = []
+
+    async def create(self, requests):
+        self.requests = requests
+        return MagicMock(id="batch-1", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        if self.on_retrieve:
+            self.on_retrieve()
+        return MagicMock(id=batch_id, processing_status="ended")
+
+    async def results(self, batch_id):
+        async def entries():
+            for request in self.requests:
+                entry = MagicMock(custom_id=request["custom_id"])
+                entry.result.type = "succeeded"
+                entry.result.message.content = [MagicMock(text=json.dumps(self.analysis))]
+                yield entry
+        return entries()
+
+
+class TestProcessTranscripts:
+    """Test processing transcripts with a mocked Claude client."""
+
+    @pytest.fixture(autouse=True)
+    def analysis_cache_dir(self, tmp_path, monkeypatch):
+        import process_transcripts
+        cache_dir = tmp_path / "analysis-cache"
+        monkeypatch.setattr(process_transcripts, "ANALYSIS_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        vault_path = tmp_path / "vault"
+        transcripts_path = vault_path / "Meetings" / "Transcripts"
+        transcripts_path.mkdir(parents=True)
+        daily_path = vault_path / "Daily"
+        daily_path.mkdir()
+        (daily_path / "2026-01-15.md").write_text("# 2026-01-15\n\n## Work\n\n---\n\n## Meetings\n", encoding="utf-8")
+
+        for title in ("Alpha", "Beta"):
+            (transcripts_path / f"2026-01-15 - {title}.md").write_text(
+                f"---\ndate: 2026-01-15\ntitle: {title}\nprocessed: false\n---\n\n"
+                "## Notes\n\n*No AI notes available - will be generated during processing*\n\n"
+                "---\n\n## Transcript\n\n" + "We talked about the launch plan. " * 10,
+                encoding="utf-8",
+            )
+
+        return {
+            "obsidian_vault": vault_path,
+            "transcripts_folder": "Meetings/Transcripts",
+            "daily_folder": "Daily",
+            "projects_index": "index.md",
+        }
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        client.messages = FakeMessages({
+            "action_items": ["Ship it"],
+            "project_updates": [],
+            "summary": "Discussed launch",
+        })
+        return client
+
+    async def test_process_transcripts_updates_all_files(self, config, client):
+        """Concurrent processing should update every transcript and the shared daily file."""
+        from process_transcripts import process_transcripts
+        from utils import get_unprocessed_transcripts, parse_frontmatter
+
+        transcripts = get_unprocessed_transcripts(config)
+        processed = await process_transcripts(transcripts, config, client, "")
+
+        assert processed == 2
+        assert client.messages.calls == 2
+        daily = (config["obsidian_vault"] / "Daily" / "2026-01-15.md").read_text(encoding="utf-8")
+        assert "*From Alpha:*" in daily
+        assert "*From Beta:*" in daily
+        for path in transcripts:
+            frontmatter, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+            assert frontmatter["processed"] is True
+            assert "- Discussed launch" in body
+
+    async def test_process_transcripts_skips_unreadable_frontmatter(self, config, client):
+        """A transcript whose frontmatter won't parse should be left alone, not analyzed."""
+        from process_transcripts import process_transcripts
+
+        path = config["obsidian_vault"] / "Meetings" / "Transcripts" / "broken.md"
+        content = (
+            "---\ntitle: [unclosed\nprocessed: false\n---\n\n## Transcript\n\n"
+            + "We talked about the launch plan. " * 10
+        )
+        path.write_text(content, encoding="utf-8")
+
+        processed = await process_transcripts([path], config, client, "")
+
+        assert processed == 0
+        assert client.messages.calls == 0
+        assert path.read_text(encoding="utf-8") == content
+
+    def test_create_client_ignores_bare_aiohttp(self, monkeypatch):
+        """aiohttp without the anthropic[aiohttp] extra should fall back to httpx."""
+        import types
+        from process_transcripts import create_client
+
+        monkeypatch.setitem(sys.modules, "aiohttp", types.ModuleType("aiohttp"))
+        monkeypatch.setitem(sys.modules, "httpx_aiohttp", None)
+
+        client = create_client("test-key")
+
+        assert client.api_key == "test-key"
+
+    def test_update_project_file_inserts_once(self, config):
+        """A repeated Meeting Notes heading should only get the entry under the first one."""
+        from process_transcripts import update_project_file
+
+        project_path = config["obsidian_vault"] / "project.md"
+        project_path.write_text("# Project\n\n## Meeting Notes\n\n## Meeting Notes\n", encoding="utf-8")
+        update = {"file": "project.md", "summary": "- Agreed on scope"}
+
+        assert update_project_file(update, "2026-01-15", "Alpha", config)
+        content = project_path.read_text(encoding="utf-8")
+        assert content.count("### 2026-01-15 - Alpha") == 1
+        assert content.index("### 2026-01-15 - Alpha") < content.rindex("## Meeting Notes")
+
+    async def test_reprocessing_uses_cached_analysis(self, config, client):
+        """Re-running on identical transcripts should not call Claude again."""
+        from process_transcripts import process_transcripts
+        from utils import get_unprocessed_transcripts
+
+        transcripts = get_unprocessed_transcripts(config)
+        originals = {path: path.read_text(encoding="utf-8") for path in transcripts}
+        await process_transcripts(transcripts, config, client, "")
+
+        for path, content in originals.items():
+            path.write_text(content, encoding="utf-8")
+        processed = await process_transcripts(transcripts, config, client, "")
+
+        assert processed == 2
+        assert client.messages.calls == 2
+
+    async def test_process_transcripts_batch_updates_all_files(self, config, client):
+        """Batch processing should submit one request per transcript and apply each result."""
+        from process_transcripts import process_transcripts_batch
+        from utils import get_unprocessed_transcripts, parse_frontmatter
+
+        client.messages.batches = FakeBatches(client.messages.analysis)
+        config["batch_poll_seconds"] = 0
+        transcripts = get_unprocessed_transcripts(config)
+        processed = await process_transcripts_batch(transcripts, config, client, "")
+
+        assert processed == 2
+        assert len(client.messages.batches.requests) == 2
+        daily = (config["obsidian_vault"] / "Daily" / "2026-01-15.md").read_text(encoding="utf-8")
+        assert "*From Alpha:*" in daily
+        assert "*From Beta:*" in daily
+        for path in transcripts:
+            frontmatter, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+            assert frontmatter["processed"] is True
+            assert "- Discussed launch" in body
+
+    async def test_process_transcripts_batch_keeps_edits_made_while_waiting(self, config, client):
+        """Results should apply to the file as it is when the batch ends, not when submitted."""
+        from process_transcripts import process_transcripts_batch
+        from utils import get_unprocessed_transcripts, parse_frontmatter
+
+        transcripts = get_unprocessed_transcripts(config)
+        alpha, beta = sorted(transcripts)
+
+        def edit_in_obsidian():
+            alpha.write_text(alpha.read_text(encoding="utf-8") + "\nAdded while waiting\n", encoding="utf-8")
+            beta.write_text(
+                beta.read_text(encoding="utf-8").replace("processed: false", "processed: true"),
+                encoding="utf-8",
+            )
+
+        client.messages.batches = FakeBatches(client.messages.analysis, on_retrieve=edit_in_obsidian)
+        config["batch_poll_seconds"] = 0
+        processed = await process_transcripts_batch(transcripts, config, client, "")
+
+        assert processed == 1
+        frontmatter, body = parse_frontmatter(alpha.read_text(encoding="utf-8"))
+        assert frontmatter["processed"] is True
+        assert "Added while waiting" in body
+        assert "- Discussed launch" in body
+        daily = (config["obsidian_vault"] / "Daily" / "2026-01-15.md").read_text(encoding="utf-8")
+        assert "*From Beta:*" not in daily
@@ -3,30 +3,107 @@
 Shared utilities for Granola → Obsidian sync.
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
 import re
+import stat
 import sys
-from datetime import datetime, timedelta
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# orjson is an optional speedup; its decode errors subclass json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
 # Shared log file location
 LOG_DIR = Path.home() / "Library" / "Logs"
-LOG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = LOG_DIR / "granola-sync.log"
 
+# Background writer for log records, started by the first setup_logging call
+_log_listener = None
+
+# Index of synced Granola documents, stored at the vault root
+SYNC_INDEX_FILENAME = ".granola-sync-index.json"
+
+# Worker threads used by map_frontmatter to read many files' frontmatter
+FRONTMATTER_MAX_WORKERS = 8
+
+_NOTES_KEYS = ("notes_markdown", "notes_plain", "notes")
+
+
+# Python 3.11+ fromisoformat accepts the Z suffix and full ISO 8601
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Frontmatter shapes _fast_frontmatter parses without PyYAML
+_FM_KEY_RE = re.compile(r"([A-Za-z_][\w-]*):(?: (.*))?$")
+_FM_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+_FM_PLAIN_START = re.compile(r"[A-Za-z_(]")
+_FM_YAML_WORDS = {"null", "~", "yes", "no", "on", "off", "y", "n", "true", "false"}
+# Tabs (which can end a plain scalar before "#" or after ":"), YAML line
+# breaks other than "\n", a BOM, and anything outside YAML's printable set
+_FM_UNSAFE_CHAR_RE = re.compile(
+    "[^\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]"
+)
+_AMBIGUOUS = object()
+
+# Characters YAML treats as line breaks; a plain scalar can't contain them
+_YAML_LINE_BREAK_RE = re.compile("[\n\r\x85\u2028\u2029]")
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string; dates and other non-JSON values become strings."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
 
 def setup_logging(name: str = __name__) -> logging.Logger:
-    """Configure and return a logger with file and console handlers."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(LOG_FILE),
+    """
+    Configure and return a logger with file and console handlers.
+
+    Records are handed to a background thread that writes them, so logging
+    calls on the sync path don't wait on file or console I/O.
+    """
+    global _log_listener
+    if _log_listener is None:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        handlers = [
+            logging.FileHandler(LOG_FILE, delay=True),
             logging.StreamHandler(sys.stdout)
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        # Flush queued records before the interpreter exits
+        atexit.register(_log_listener.stop)
+
+        # The listener's handlers apply the real format
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
     return logging.getLogger(name)
 
 
@@ -35,15 +112,29 @@ logger = setup_logging("granola-sync")
 
 
 def load_config() -> dict:
-    """Load configuration from config.yaml."""
+    """
+    Load configuration from config.yaml.
+
+    The parsed config is memoized per (mtime, size), so long-running callers
+    like the MCP server only reparse after the file is edited. Callers must
+    treat the returned dict as read-only.
+    """
     config_path = Path(__file__).parent / "config.yaml"
-    if not config_path.exists():
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         logger.error(f"Config file not found: {config_path}")
         logger.error("Copy config.example.yaml to config.yaml and update paths")
         sys.exit(1)
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    return _parse_config(str(config_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse and validate config.yaml; mtime_ns and size only key the memo."""
+    with open(config_path, encoding="utf-8") as f:
+        config = yaml.load(f, Loader=_SafeLoader)
 
     # Validate required keys
     required_keys = {"granola_cache", "obsidian_vault", "transcripts_folder", "daily_folder"}
@@ -64,18 +155,136 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if not content.startswith("---"):
         return {}, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # Locate the closing delimiter instead of splitting, so the body is
+    # sliced once and "---" inside a value doesn't end the block
+    end = content.find("\n---", 3)
+    if end == -1:
         return {}, content
 
     try:
-        frontmatter = yaml.safe_load(parts[1])
-        body = parts[2].lstrip()
+        frontmatter = _fast_frontmatter(content[3:end])
+        if frontmatter is None:
+            frontmatter = yaml.load(content[3:end], Loader=_SafeLoader)
+        body = content[end + 4:].lstrip()
         return frontmatter or {}, body
     except yaml.YAMLError:
         return {}, content
 
 
+def _fast_scalar(value: str):
+    """
+    Convert a frontmatter scalar the way YAML would, for the unambiguous
+    forms format_frontmatter writes. Returns _AMBIGUOUS for anything else.
+    """
+    if not value:
+        return _AMBIGUOUS
+    if value in ("true", "false"):
+        return value == "true"
+    if value.isascii() and value.isdigit():
+        return int(value) if value[0] != "0" or value == "0" else _AMBIGUOUS
+    if _FM_DATE_RE.match(value):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return _AMBIGUOUS
+    if value[0] == '"':
+        inner = value[1:-1]
+        if len(value) >= 2 and value[-1] == '"' and '"' not in inner and "\\" not in inner:
+            return inner
+        return _AMBIGUOUS
+    if (
+        _FM_PLAIN_START.match(value)
+        and value.lower() not in _FM_YAML_WORDS
+        and ": " not in value
+        and " #" not in value
+        and not value.endswith(":")
+        and not value[-1].isspace()
+    ):
+        return value
+    return _AMBIGUOUS
+
+
+def _fast_frontmatter(text: str) -> dict | None:
+    """
+    Parse the flat frontmatter written by format_frontmatter without YAML.
+
+    Returns None when any line falls outside that shape, so the caller can
+    fall back to a full YAML parse.
+    """
+    if _FM_UNSAFE_CHAR_RE.search(text):
+        return None
+    lines = text.split("\n")
+    if lines[0].strip(" "):
+        return None
+
+    frontmatter = {}
+    current_list = None
+    for line in lines[1:]:
+        if line.startswith("  - "):
+            if current_list is None:
+                return None
+            value = _fast_scalar(line[4:].rstrip(" "))
+            if value is _AMBIGUOUS:
+                return None
+            current_list.append(value)
+            continue
+
+        match = _FM_KEY_RE.match(line)
+        if not match or match.group(1).lower() in _FM_YAML_WORDS:
+            return None
+        key, value = match.group(1), (match.group(2) or "").rstrip(" ")
+        if not value:
+            # A bare key is a list if items follow, otherwise null
+            current_list = frontmatter[key] = []
+            continue
+        value = _fast_scalar(value)
+        if value is _AMBIGUOUS:
+            return None
+        frontmatter[key] = value
+        current_list = None
+
+    return {key: (value if value != [] else None) for key, value in frontmatter.items()}
+
+
+def _str_dates(value):
+    """Return value with dates (alone or in a list) converted to ISO strings."""
+    if isinstance(value, date):
+        return str(value)
+    if isinstance(value, list):
+        return [str(item) if isinstance(item, date) else item for item in value]
+    return value
+
+
+def parse_frontmatter_fields(content: str, keys: set[str]) -> dict:
+    """
+    Extract selected frontmatter fields.
+
+    Values are parsed exactly as parse_frontmatter parses them, except that
+    dates are returned as strings. Unparseable frontmatter yields {}.
+    """
+    frontmatter, _ = parse_frontmatter(content)
+    if not isinstance(frontmatter, dict):
+        return {}
+    return {key: _str_dates(value) for key, value in frontmatter.items() if key in keys}
+
+
+def format_yaml_scalar(value: str) -> str:
+    """
+    Format a string for a frontmatter line, plain when YAML reads it back
+    unchanged and double-quoted (with escaping) otherwise.
+    """
+    if ":" not in value and '"' not in value and not _YAML_LINE_BREAK_RE.search(value):
+        try:
+            if yaml.load(value, Loader=_SafeLoader) == value:
+                return value
+        except yaml.YAMLError:
+            pass
+
+    return yaml.dump(
+        value, Dumper=_SafeDumper, default_style='"', allow_unicode=True, width=2**31 - 1
+    ).rstrip("\n")
+
+
 def format_frontmatter(data: dict) -> str:
     """Format a dictionary as YAML frontmatter string."""
     lines = ["---"]
@@ -83,17 +292,159 @@ def format_frontmatter(data: dict) -> str:
         if key == "attendees" and isinstance(value, list):
             lines.append("attendees:")
             for att in value:
+                att = format_yaml_scalar(att) if isinstance(att, str) else att
                 lines.append(f"  - {att}")
         elif isinstance(value, bool):
             lines.append(f"{key}: {str(value).lower()}")
-        elif isinstance(value, str) and (":" in value or '"' in value):
-            lines.append(f'{key}: "{value}"')
+        elif isinstance(value, str):
+            lines.append(f"{key}: {format_yaml_scalar(value)}")
         else:
             lines.append(f"{key}: {value}")
     lines.append("---")
     return "\n".join(lines)
 
 
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask can only be queried by setting it, which
+# isn't safe once sync worker threads are creating files
+_UMASK = _read_umask()
+
+
+def atomic_write_bytes(path: Path, data: bytes | list[bytes]) -> None:
+    """
+    Write data to a sibling temp file and rename it over path.
+
+    data may be a list of chunks, which are written in order with writev
+    instead of being joined first. Each call gets its own temp file, so
+    concurrent writers of the same path (launchd and MCP syncs) can't
+    interleave into one.
+    """
+    chunks = [data] if isinstance(data, bytes) else data
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            # mkstemp creates the file owner-only; keep the target's mode, or
+            # give a new file the mode open(path, "w") would
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.fchmod(fd, mode)
+            views = [memoryview(chunk) for chunk in chunks if chunk]
+            while views:
+                written = os.writev(fd, views)
+                # Drop fully written chunks and trim a partially written one
+                while views and written >= len(views[0]):
+                    written -= len(views.pop(0))
+                if written:
+                    views[0] = views[0][written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def get_sync_index_path(config: dict) -> Path:
+    """Get path to the index of already-synced Granola documents."""
+    return config["obsidian_vault"] / SYNC_INDEX_FILENAME
+
+
+def load_sync_index(config: dict) -> dict[str, str] | None:
+    """
+    Load the sync index mapping granola_id to transcript filename.
+
+    Returns None for a missing, unreadable or malformed index, so sync can
+    rebuild it from transcript frontmatter. Entries that aren't a string id
+    mapped to a string filename are dropped.
+    """
+    index_path = get_sync_index_path(config)
+    try:
+        with open(index_path, "rb") as f:
+            index = json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable sync index {index_path}: {e}")
+        return None
+
+    if not isinstance(index, dict):
+        logger.warning(f"Ignoring malformed sync index {index_path}")
+        return None
+    return {k: v for k, v in index.items() if isinstance(k, str) and isinstance(v, str)}
+
+
+def save_sync_index(config: dict, index: dict[str, str]) -> None:
+    """Write the sync index mapping granola_id to transcript filename."""
+    index_path = get_sync_index_path(config)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(index_path, json.dumps(index, indent=2, sort_keys=True).encode())
+
+
+def rebuild_sync_index(transcripts_dir: Path) -> dict[str, str]:
+    """
+    Rebuild the sync index from the granola_id in each transcript's frontmatter.
+
+    Only the frontmatter blocks are read, several files at a time.
+    """
+    try:
+        with os.scandir(transcripts_dir) as it:
+            names = [entry.name for entry in it if entry.name.endswith(".md")]
+    except FileNotFoundError:
+        return {}
+
+    granola_ids = [
+        str(fields["granola_id"]) if fields and fields.get("granola_id") is not None else None
+        for fields in map_frontmatter([transcripts_dir / name for name in names], {"granola_id"})
+    ]
+
+    # Sorted so a duplicated granola_id deterministically maps to one file
+    return {
+        granola_id: name
+        for name, granola_id in sorted(zip(names, granola_ids), reverse=True)
+        if granola_id
+    }
+
+
+def read_frontmatter_block(file_path: str | Path) -> bytes:
+    """Read only the raw frontmatter block at the top of a markdown file."""
+    with open(file_path, "rb") as f:
+        first = f.readline()
+        if first.rstrip() != b"---":
+            return b""
+        lines = [first]
+        for line in f:
+            lines.append(line)
+            if line.rstrip() == b"---":
+                break
+    return b"".join(lines)
+
+
+def map_frontmatter(paths: list[str | Path], keys: set[str]) -> list[dict | None]:
+    """
+    Read selected frontmatter fields (see parse_frontmatter_fields) from
+    several files at a time, since each is an independent small read.
+
+    Returns one result per path, in order; None for a file that can't be read.
+    """
+    def read_fields(path: str | Path) -> dict | None:
+        try:
+            head = read_frontmatter_block(path)
+        except OSError:
+            return None
+        return parse_frontmatter_fields(head.decode("utf-8", errors="replace"), keys)
+
+    with ThreadPoolExecutor(max_workers=FRONTMATTER_MAX_WORKERS) as executor:
+        return list(executor.map(read_fields, paths))
+
+
 def get_unprocessed_transcripts(config: dict, older_than_hours: int = 0) -> list[Path]:
     """
     Find unprocessed transcript files.
@@ -110,50 +461,53 @@ def get_unprocessed_transcripts(config: dict, older_than_hours: int = 0) -> list
     if not transcripts_dir.exists():
         return []
 
-    cutoff = datetime.now() - timedelta(hours=older_than_hours) if older_than_hours > 0 else None
-    unprocessed = []
-
-    for file_path in transcripts_dir.glob("*.md"):
-        content = file_path.read_text()
-
-        if "processed: false" not in content:
-            continue
-
-        if cutoff:
-            date_match = re.search(r"date: (\d{4}-\d{2}-\d{2})", content)
-            if date_match:
-                try:
-                    file_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                    if file_date >= cutoff:
-                        continue  # Skip files newer than cutoff
-                except ValueError:
-                    pass
-
-        unprocessed.append(file_path)
-
-    return sorted(unprocessed)
+    # A file is too new when its date's midnight is at or after the cutoff,
+    # i.e. its date is on or after the first midnight not before the cutoff
+    cutoff_date = None
+    if older_than_hours > 0:
+        cutoff = datetime.now() - timedelta(hours=older_than_hours)
+        first_day = cutoff.date() if cutoff.time() == time.min else cutoff.date() + timedelta(days=1)
+        cutoff_date = first_day.isoformat()
+
+    # is_file() uses the type scandir already returned, so this costs no stat
+    with os.scandir(transcripts_dir) as it:
+        entries = [entry.path for entry in it if entry.name.endswith(".md") and entry.is_file()]
+
+    def is_unprocessed(fields: dict | None) -> bool:
+        if not fields or fields.get("processed") is not False:
+            return False
+
+        if cutoff_date:
+            # Dates come back as ISO strings, which compare in date order
+            date_str = str(fields.get("date", ""))[:10]
+            if _FM_DATE_RE.match(date_str) and date_str >= cutoff_date:
+                return False  # Skip files newer than cutoff
+
+        return True
+
+    # Both flags live in the frontmatter, so skip reading the transcript bodies
+    frontmatters = map_frontmatter(entries, {"processed", "date"})
+    return sorted(
+        Path(entry_path) for entry_path, fields in zip(entries, frontmatters) if is_unprocessed(fields)
+    )
 
 
 def parse_iso_timestamp(ts_string: str) -> datetime | None:
     """Parse ISO 8601 timestamp with Z suffix."""
     if not ts_string:
         return None
+    if not _FROMISO_HANDLES_Z:
+        ts_string = ts_string.replace("Z", "+00:00")
     try:
-        return datetime.fromisoformat(ts_string.replace("Z", "+00:00"))
+        return datetime.fromisoformat(ts_string)
     except ValueError:
         return None
 
 
 def get_notes_text(doc: dict) -> str:
     """Extract notes from document, trying markdown first, then plain, then raw."""
-    notes_markdown = doc.get("notes_markdown")
-    notes_plain = doc.get("notes_plain")
-    notes_raw = doc.get("notes")
-
-    if isinstance(notes_markdown, str) and notes_markdown:
-        return notes_markdown
-    if isinstance(notes_plain, str) and notes_plain:
-        return notes_plain
-    if isinstance(notes_raw, str) and notes_raw:
-        return notes_raw
+    for key in _NOTES_KEYS:
+        notes = doc.get(key)
+        if notes and isinstance(notes, str):
+            return notes
     return ""